@@ -1,11 +1,38 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
 
 from ..model.document import Document
 from ..model.shapes import CircleSpec, RectSpec, ShapeSpec
 
+_PREAMBLE = (
+    b"; Linux Engraver stub G-code\n"
+    b"G90 ; absolute positioning\n"
+    b"G21 ; units in mm\n"
+    b"G0 Z5.0 ; safe height\n"
+)
+_POSTAMBLE = (
+    b"G0 Z5.0\n"
+    b"M5 ; spindle stop\n"
+    b"M2 ; program end\n"
+)
+
+# Move templates, %-formatted straight to bytes
+_FMT_G0 = b"G0 X%.3f Y%.3f\n"
+_FMT_G1 = b"G1 X%.3f Y%.3f F600.0\n"
+_FMT_G1_NF = b"G1 X%.3f Y%.3f\n"
+_PLUNGE = b"G1 Z0.000 F300.0\n"
+_RETRACT = b"G0 Z5.000\n"
+
+# Full circle: rapid to (cx + r, cy), plunge, one arc back to the start
+# around the centre at offset I=-r, J=0, then retract
+_FMT_CIRCLE = (
+    b"G0 X%.3f Y%.3f\n"
+    + _PLUNGE
+    + b"G3 X%.3f Y%.3f I%.3f J0.000 F600.0\n"
+    + _RETRACT
+)
+
 
 def export_gcode(doc: Document, path: Path) -> None:
     """Very early placeholder: emit simple contour moves at Z=0.
@@ -13,55 +40,39 @@ def export_gcode(doc: Document, path: Path) -> None:
     NOTE: Real toolpathing requires CAM logic (tool diameter, stepover, depth per pass, 
     lead-ins/outs, safe Z, spindle control, units, etc). This stub just proves plumbing.
     """
-    lines: list[str] = []
-    lines.extend(_preamble())
+    buf = bytearray(_PREAMBLE)
     for s in doc.shapes:
-        lines.extend(_shape_to_gcode(s))
-    lines.extend(_postamble())
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-
-def _preamble() -> list[str]:
-    return [
-        "; Linux Engraver stub G-code",
-        "G90 ; absolute positioning",
-        "G21 ; units in mm",
-        "G0 Z5.0 ; safe height",
-    ]
-
-
-def _postamble() -> list[str]:
-    return [
-        "G0 Z5.0",
-        "M5 ; spindle stop",
-        "M2 ; program end",
-    ]
-
-
-def _shape_to_gcode(s: ShapeSpec) -> Iterable[str]:
-    if isinstance(s, RectSpec):
-        x, y, w, h = s.x, s.y, s.w, s.h
-        return [
-            f"G0 X{x:.3f} Y{y:.3f}",
-            "G1 Z0.000 F300.0",
-            f"G1 X{x + w:.3f} Y{y:.3f} F600.0",
-            f"G1 X{x + w:.3f} Y{y + h:.3f}",
-            f"G1 X{x:.3f} Y{y + h:.3f}",
-            f"G1 X{x:.3f} Y{y:.3f}",
-            "G0 Z5.000",
-        ]
-    if isinstance(s, CircleSpec):
-        # Approximate with 36-segment polygon
-        cx, cy, r = s.cx, s.cy, s.r
-        import math
-
-        pts = [
-            (cx + r * math.cos(2 * math.pi * i / 36), cy + r * math.sin(2 * math.pi * i / 36))
-            for i in range(37)
-        ]
-        lines: list[str] = [f"G0 X{pts[0][0]:.3f} Y{pts[0][1]:.3f}", "G1 Z0.000 F300.0"]
-        for x, y in pts[1:]:
-            lines.append(f"G1 X{x:.3f} Y{y:.3f} F600.0")
-        lines.append("G0 Z5.000")
-        return lines
-    return []
+        _shape_to_gcode(s, buf)
+    buf += _POSTAMBLE
+    path.write_bytes(buf)
+
+
+def _shape_to_gcode(s: ShapeSpec, buf: bytearray) -> None:
+    emit = _EMITTERS.get(type(s))
+    if emit is not None:
+        emit(s, buf)
+
+
+def _emit_rect(s: RectSpec, buf: bytearray) -> None:
+    x, y, w, h = s.x, s.y, s.w, s.h
+    buf += _FMT_G0 % (x, y)
+    buf += _PLUNGE
+    buf += _FMT_G1 % (x + w, y)
+    buf += _FMT_G1_NF % (x + w, y + h)
+    buf += _FMT_G1_NF % (x, y + h)
+    buf += _FMT_G1_NF % (x, y)
+    buf += _RETRACT
+
+
+def _emit_circle(s: CircleSpec, buf: bytearray) -> None:
+    cx, cy, r = s.cx, s.cy, s.r
+    # A radius that rounds to 0.000 would be a zero-radius arc, which
+    # controllers reject; such a circle has nothing to cut anyway
+    if r < 0.0005:
+        return
+    # round() then `or` turns -0.0 into 0.0 so the offset never prints "-0.000"
+    i = round(-r, 3) or 0.0
+    buf += _FMT_CIRCLE % (cx + r, cy, cx + r, cy, i)
+
+
+_EMITTERS = {RectSpec: _emit_rect, CircleSpec: _emit_circle}
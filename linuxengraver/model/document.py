@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import List, Union
 
 from pydantic import BaseModel, Field
 
@@ -17,13 +17,18 @@ class Document(BaseModel):
     def to_json(self) -> str:
         return self.model_dump_json(indent=2)
 
+    def to_json_compact(self) -> bytes:
+        # Unindented, and bytes straight from pydantic-core's serializer
+        return self.__pydantic_serializer__.to_json(self)
+
     @classmethod
-    def from_json(cls, data: str) -> "Document":
+    def from_json(cls, data: Union[str, bytes]) -> "Document":
+        # pydantic-core parses str or bytes directly; no Python-side decode needed
         return cls.model_validate_json(data)
 
     def save_json(self, path: Path) -> None:
-        path.write_text(self.to_json(), encoding="utf-8")
+        path.write_bytes(self.to_json_compact())
 
     @classmethod
     def load_json(cls, path: Path) -> "Document":
-        return cls.from_json(path.read_text(encoding="utf-8"))
+        return cls.from_json(path.read_bytes())
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class _BaseShape(BaseModel):
@@ -26,3 +26,6 @@ class CircleSpec(_BaseShape):
 
 # Discriminated union for shape specs
 ShapeSpec = Annotated[Union[RectSpec, CircleSpec], Field(discriminator="type")]
+
+# Built once; use for validating/dumping individual shapes outside a Document
+SHAPE_ADAPTER: TypeAdapter[ShapeSpec] = TypeAdapter(ShapeSpec)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QAction, QIcon, QActionGroup
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -36,6 +36,12 @@ class MainWindow(QMainWindow):
         self.canvas = CanvasView(self)
         self.setCentralWidget(self.canvas)
 
+        # Coalesce rapid spinbox edits (e.g. typing "123") into one material update
+        self._material_timer = QTimer(self)
+        self._material_timer.setSingleShot(True)
+        self._material_timer.setInterval(100)
+        self._material_timer.timeout.connect(self._apply_material_now)
+
         # Docks and menus
         self._create_material_dock()
         self._create_menus()
@@ -221,13 +227,22 @@ class MainWindow(QMainWindow):
 
     # Material handling
     def _material_changed(self) -> None:
-        self.document.material = Material(
+        self._material_timer.start()
+
+    def _apply_material_now(self) -> None:
+        self._material_timer.stop()
+        # Spinbox ranges already guarantee positive values
+        self.document.material = Material.model_construct(
             width=float(self.spin_width.value()),
             height=float(self.spin_height.value()),
             thickness=float(self.spin_thickness.value()),
         )
         self._apply_material_to_canvas()
 
+    def _flush_material(self) -> None:
+        if self._material_timer.isActive():
+            self._apply_material_now()
+
     def _apply_material_to_canvas(self) -> None:
         self.canvas.set_workspace_size(self.document.material.width, self.document.material.height)
 
@@ -237,14 +252,17 @@ class MainWindow(QMainWindow):
 
     # File actions
     def action_new(self) -> None:
+        self._flush_material()
         self.document = Document(material=self.document.material.copy())
         self.canvas.clear_shapes()
+        self.canvas.mark_clean()
         self.current_file = None
         # Fit the material in the view for a fresh document
         self._apply_material_to_canvas()
         self._update_window_title()
 
     def action_open(self) -> None:
+        self._flush_material()
         path_str, _ = QFileDialog.getOpenFileName(self, "Open Design", str(self.current_file or ""), "Design (*.json)")
         if not path_str:
             return
@@ -307,6 +325,11 @@ class MainWindow(QMainWindow):
         self.canvas.clear_shapes()
         for spec in self.document.shapes:
             self.canvas.add_shape_from_spec(spec)
+        self.canvas.mark_clean()
 
     def _sync_document_from_canvas(self) -> None:
+        self._flush_material()
+        if not self.canvas.is_dirty():
+            return
         self.document.shapes = [s for s in self.canvas.export_shape_specs()]
+        self.canvas.mark_clean()
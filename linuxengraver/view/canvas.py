@@ -1,13 +1,69 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional
 
-from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer
 from PySide6.QtGui import QBrush, QPen
 from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsItem, QGraphicsRectItem, QGraphicsScene, QGraphicsView
 
 from ..model.shapes import CircleSpec, RectSpec, ShapeSpec
 
+# Above this many shapes, repainting one bounding rect per change tends to
+# cover most of the viewport anyway; let Qt pick the update region instead.
+_SMART_UPDATE_THRESHOLD = 512
+
+# Visuals, shared by every item
+_PEN_SHAPE = QPen(Qt.black, 1)
+_BRUSH_TRANS = QBrush(Qt.transparent)
+_PEN_WS = QPen(Qt.darkGray, 1, Qt.DashLine)
+_BRUSH_WHITE = QBrush(Qt.white)
+
+
+class _RectShape(QGraphicsRectItem):
+    """User rectangle; reports moves so the canvas knows its specs changed."""
+
+    def __init__(self, rect: QRectF, on_moved: Callable[[], None]) -> None:
+        super().__init__(rect)
+        self._on_moved = on_moved
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+
+    def itemChange(self, change, value):  # noqa: N802
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            self._on_moved()
+        return super().itemChange(change, value)
+
+
+class _EllipseShape(QGraphicsEllipseItem):
+    """User circle; reports moves so the canvas knows its specs changed."""
+
+    def __init__(self, rect: QRectF, on_moved: Callable[[], None]) -> None:
+        super().__init__(rect)
+        self._on_moved = on_moved
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+
+    def itemChange(self, change, value):  # noqa: N802
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            self._on_moved()
+        return super().itemChange(change, value)
+
+
+# Geometry comes straight from Qt items, so specs are built without validation.
+# Dragging an item moves pos(), not rect(), so both are combined.
+def _rect_to_spec(item: QGraphicsRectItem) -> RectSpec:
+    rect = item.rect().translated(item.pos())
+    return RectSpec.model_construct(type="rect", x=rect.x(), y=rect.y(), w=rect.width(), h=rect.height())
+
+
+def _ellipse_to_spec(item: QGraphicsEllipseItem) -> CircleSpec:
+    rect = item.rect().translated(item.pos())
+    cx = rect.x() + rect.width() / 2
+    cy = rect.y() + rect.height() / 2
+    r = rect.width() / 2
+    return CircleSpec.model_construct(type="circle", cx=cx, cy=cy, r=r)
+
+
+_EXPORTERS = {_RectShape: _rect_to_spec, _EllipseShape: _ellipse_to_spec}
+
 
 class CanvasView(QGraphicsView):
     """Simple canvas built on QGraphicsView/Scene.
@@ -21,21 +77,36 @@ class CanvasView(QGraphicsView):
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        # Items are plain stroked shapes that don't clip or leave painter state behind
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing)
 
         self._scene = QGraphicsScene(self)
+        # The drawing preview is resized on every mouse move; a BSP index would
+        # be rebuilt constantly, and linear scans are fine at our item counts.
+        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self._scene)
 
         self._workspace_rect: Optional[QGraphicsRectItem] = None
+        self._workspace_rect_geom: Optional[QRectF] = None
         self._tool: str = "select"
+        # User shapes in insertion order (excludes workspace and preview items)
+        self._shape_items: List[QGraphicsItem] = []
+        # Set when shapes change so callers can skip re-exporting an unchanged scene
+        self._dirty = False
 
         # Drawing state
         self._drag_start: Optional[QPointF] = None
         self._preview_item: Optional[QGraphicsItem] = None
 
-        # Visuals
-        self._pen_shape = QPen(Qt.black, 1)
-        self._brush_shape = QBrush(Qt.transparent)
-        self._pen_workspace = QPen(Qt.darkGray, 1, Qt.DashLine)
+        # Coalesce preview resizes to ~60 Hz; mice can report moves at 1 kHz+
+        self._pending_pos: Optional[QPointF] = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._flush_preview)
+
+        # One persistent preview per drawing tool, shown while dragging
+        self._add_preview_items()
 
         # Zoom state
         self._zoom_factor = 1.0
@@ -45,19 +116,35 @@ class CanvasView(QGraphicsView):
     def set_workspace_size(self, width_mm: float, height_mm: float) -> None:
         # Map 1 mm to 1 px for now; later we can scale with DPI/zoom
         rect = QRectF(0, 0, width_mm, height_mm)
+        self._workspace_rect_geom = rect
         if self._workspace_rect is None:
-            self._workspace_rect = QGraphicsRectItem(rect)
-            self._workspace_rect.setPen(self._pen_workspace)
-            self._workspace_rect.setBrush(QBrush(Qt.white))
-            self._workspace_rect.setZValue(-100)
-            self._workspace_rect.setFlag(QGraphicsItem.ItemIsSelectable, False)
-            self._workspace_rect.setFlag(QGraphicsItem.ItemIsMovable, False)
-            self._scene.addItem(self._workspace_rect)
+            self._add_workspace_rect()
         else:
             self._workspace_rect.setRect(rect)
         self._scene.setSceneRect(rect.adjusted(-50, -50, 50, 50))
         self._fit_workspace_when_ready()
 
+    def _add_workspace_rect(self) -> None:
+        self._workspace_rect = QGraphicsRectItem(self._workspace_rect_geom)
+        self._workspace_rect.setPen(_PEN_WS)
+        self._workspace_rect.setBrush(_BRUSH_WHITE)
+        self._workspace_rect.setZValue(-100)
+        self._workspace_rect.setFlag(QGraphicsItem.ItemIsSelectable, False)
+        self._workspace_rect.setFlag(QGraphicsItem.ItemIsMovable, False)
+        self._scene.addItem(self._workspace_rect)
+
+    def _add_preview_items(self) -> None:
+        self._prev_rect = QGraphicsRectItem()
+        self._prev_ell = QGraphicsEllipseItem()
+        for item in (self._prev_rect, self._prev_ell):
+            self._style_item(item)
+            item.setFlag(QGraphicsItem.ItemIsSelectable, False)
+            item.setFlag(QGraphicsItem.ItemIsMovable, False)
+            item.setOpacity(0.7)
+            item.setZValue(100)
+            item.setVisible(False)
+            self._scene.addItem(item)
+
     def _fit_workspace_when_ready(self) -> None:
         # If viewport has a size, fit now; otherwise defer to next resize/show
         if self.viewport() and self.viewport().width() > 0 and self.viewport().height() > 0:
@@ -77,50 +164,66 @@ class CanvasView(QGraphicsView):
 
     # Scene ops
     def clear_shapes(self) -> None:
-        for item in list(self._scene.items()):
-            if item is self._workspace_rect:
-                continue
-            self._scene.removeItem(item)
-        self._clear_preview()
+        # Drop everything in one go (cheaper than per-item removal), then
+        # restore the workspace and preview items that clear() deleted.
+        self._scene.clear()
+        self._update_timer.stop()
+        self._pending_pos = None
+        self._preview_item = None
+        self._drag_start = None
+        self._workspace_rect = None
+        if self._workspace_rect_geom is not None:
+            self._add_workspace_rect()
+        self._add_preview_items()
+        self._shape_items.clear()
+        self._dirty = True
+        self._update_viewport_mode()
 
     def add_shape_from_spec(self, spec: ShapeSpec) -> None:
         if isinstance(spec, RectSpec):
-            item = QGraphicsRectItem(spec.x, spec.y, spec.w, spec.h)
+            item = _RectShape(QRectF(spec.x, spec.y, spec.w, spec.h), self._mark_dirty)
         elif isinstance(spec, CircleSpec):
             # ellipse rect: top-left = center - r
-            item = QGraphicsEllipseItem(spec.cx - spec.r, spec.cy - spec.r, 2 * spec.r, 2 * spec.r)
+            item = _EllipseShape(QRectF(spec.cx - spec.r, spec.cy - spec.r, 2 * spec.r, 2 * spec.r), self._mark_dirty)
         else:
             return
         self._style_item(item)
         self._scene.addItem(item)
+        self._shape_items.append(item)
+        self._dirty = True
+        self._update_viewport_mode()
+
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
 
     def export_shape_specs(self) -> Iterable[ShapeSpec]:
         out: List[ShapeSpec] = []
-        for item in self._scene.items():
-            if item is self._workspace_rect:
-                continue
-            if isinstance(item, QGraphicsRectItem):
-                rect = item.rect()
-                out.append(RectSpec(x=rect.x(), y=rect.y(), w=rect.width(), h=rect.height()))
-            elif isinstance(item, QGraphicsEllipseItem):
-                rect = item.rect()
-                cx = rect.x() + rect.width() / 2
-                cy = rect.y() + rect.height() / 2
-                r = rect.width() / 2
-                out.append(CircleSpec(cx=cx, cy=cy, r=r))
+        for item in self._shape_items:
+            to_spec = _EXPORTERS.get(type(item))
+            if to_spec is not None:
+                out.append(to_spec(item))
         return out
 
     # Selection helpers
     def delete_selection(self) -> None:
-        for item in list(self._scene.selectedItems()):
-            if item is self._workspace_rect:
-                continue
+        removed = {item for item in self._scene.selectedItems() if item is not self._workspace_rect}
+        if not removed:
+            return
+        for item in removed:
             self._scene.removeItem(item)
+        # Rebuild once rather than list.remove() per item (quadratic on Select All)
+        self._shape_items = [i for i in self._shape_items if i not in removed]
+        self._dirty = True
+        self._update_viewport_mode()
 
     def select_all(self) -> None:
-        for item in self._scene.items():
-            if item is self._workspace_rect:
-                continue
+        for item in self._shape_items:
             item.setSelected(True)
 
     # Zoom helpers
@@ -145,41 +248,41 @@ class CanvasView(QGraphicsView):
     def mousePressEvent(self, event):  # noqa: N802
         if self._tool in ("rect", "circle") and event.button() == Qt.LeftButton:
             self._drag_start = self.mapToScene(event.pos())
-            if self._tool == "rect":
-                self._preview_item = QGraphicsRectItem()
-            else:
-                self._preview_item = QGraphicsEllipseItem()
-            self._style_item(self._preview_item)
-            self._preview_item.setOpacity(0.7)
-            self._scene.addItem(self._preview_item)
+            self._preview_item = self._prev_rect if self._tool == "rect" else self._prev_ell
+            self._preview_item.setRect(self._drag_start.x(), self._drag_start.y(), 0, 0)
+            self._preview_item.setVisible(True)
             event.accept()
             return
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):  # noqa: N802
         if self._drag_start is not None and self._preview_item is not None:
-            pos = self.mapToScene(event.pos())
-            rect = QRectF(self._drag_start, pos).normalized()
-            if isinstance(self._preview_item, QGraphicsRectItem):
-                self._preview_item.setRect(rect)
-            elif isinstance(self._preview_item, QGraphicsEllipseItem):
-                # make it a circle with radius=min half of w/h
-                s = min(rect.width(), rect.height())
-                circle_rect = QRectF(rect.topLeft(), rect.topLeft() + QPointF(s, s)).normalized()
-                self._preview_item.setRect(circle_rect)
+            self._pending_pos = self.mapToScene(event.pos())
+            if not self._update_timer.isActive():
+                self._update_timer.start()
             event.accept()
             return
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):  # noqa: N802
         if self._drag_start is not None and self._preview_item is not None and event.button() == Qt.LeftButton:
-            # finalize preview as normal item
-            self._preview_item.setOpacity(1.0)
-            self._preview_item.setFlag(QGraphicsItem.ItemIsSelectable, True)
-            self._preview_item.setFlag(QGraphicsItem.ItemIsMovable, True)
-            self._preview_item.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+            # apply the release position so the shape isn't left one tick behind
+            self._pending_pos = self.mapToScene(event.pos())
+            self._flush_preview()
+            # promote a copy of the preview geometry to a normal item
+            rect = self._preview_item.rect()
+            if self._preview_item is self._prev_rect:
+                item = _RectShape(rect, self._mark_dirty)
+            else:
+                item = _EllipseShape(rect, self._mark_dirty)
+            self._style_item(item)
+            self._scene.addItem(item)
+            self._shape_items.append(item)
+            self._preview_item.setVisible(False)
             self._preview_item = None
             self._drag_start = None
+            self._dirty = True
+            self._update_viewport_mode()
             event.accept()
             return
         super().mouseReleaseEvent(event)
@@ -187,14 +290,44 @@ class CanvasView(QGraphicsView):
     # Helpers
     def _style_item(self, item: QGraphicsItem) -> None:
         if isinstance(item, (QGraphicsRectItem, QGraphicsEllipseItem)):
-            item.setPen(self._pen_shape)
-            item.setBrush(self._brush_shape)
+            item.setPen(_PEN_SHAPE)
+            item.setBrush(_BRUSH_TRANS)
             item.setFlag(QGraphicsItem.ItemIsSelectable, True)
             item.setFlag(QGraphicsItem.ItemIsMovable, True)
 
+    def _update_viewport_mode(self) -> None:
+        if len(self._shape_items) > _SMART_UPDATE_THRESHOLD:
+            mode = QGraphicsView.SmartViewportUpdate
+        else:
+            mode = QGraphicsView.BoundingRectViewportUpdate
+        if self.viewportUpdateMode() != mode:
+            self.setViewportUpdateMode(mode)
+
+    def _flush_preview(self) -> None:
+        self._update_timer.stop()
+        pos = self._pending_pos
+        self._pending_pos = None
+        if pos is None or self._drag_start is None or self._preview_item is None:
+            return
+        # Plain floats and the 4-arg setRect overload avoid QRectF/QPointF temporaries
+        px, py = pos.x(), pos.y()
+        sx, sy = self._drag_start.x(), self._drag_start.y()
+        x = px if px < sx else sx
+        y = py if py < sy else sy
+        w = abs(px - sx)
+        h = abs(py - sy)
+        if self._preview_item is self._prev_rect:
+            self._preview_item.setRect(x, y, w, h)
+        else:
+            # make it a circle with radius=min half of w/h
+            s = w if w < h else h
+            self._preview_item.setRect(x, y, s, s)
+
     def _clear_preview(self) -> None:
+        self._update_timer.stop()
+        self._pending_pos = None
         if self._preview_item is not None:
-            self._scene.removeItem(self._preview_item)
+            self._preview_item.setVisible(False)
             self._preview_item = None
             self._drag_start = None
 